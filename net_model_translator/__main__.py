@@ -0,0 +1,3 @@
+from net_model_translator.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,319 @@
+# net_model_translator/cli.py
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from tabulate import tabulate
+
+from net_model_translator.core.arrow_model_list import ArrowModelListWriter
+from net_model_translator.core.input_schema import InputSchema
+from net_model_translator.core.translator import Translator
+from net_model_translator.input_schemas import get_all_schemas
+from net_model_translator.models import mapping
+
+INPUT_SUFFIXES = (".json", ".ndjson", ".jsonl")
+OUTPUT_FORMATS = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".json": "json",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+}
+STAGES = ("read", "translate", "serialize", "write")
+
+
+def expand_inputs(inputs: List[str]) -> List[str]:
+    """
+    Expands files, directories and glob patterns into a sorted list of input files.
+    """
+    paths = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            paths.extend(
+                str(path)
+                for path in sorted(Path(pattern).iterdir())
+                if path.suffix.lower() in INPUT_SUFFIXES
+            )
+        elif os.path.isfile(pattern):
+            paths.append(pattern)
+        else:
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+    return paths
+
+
+def resolve_input_schema(
+    data_type: str, name: Optional[str]
+) -> Optional[Type[InputSchema]]:
+    """
+    Resolves an input schema by class name within the data type's input schemas,
+    or by a dotted "package.module:ClassName" path.
+    """
+    if not name:
+        return None
+    if ":" in name:
+        module_name, class_name = name.split(":", 1)
+        schema = getattr(importlib.import_module(module_name), class_name, None)
+        if schema is None:
+            raise ValueError(f"Input schema '{class_name}' not found in {module_name}")
+        return schema
+    schemas = get_all_schemas(data_type)
+    if name.lower() not in schemas:
+        raise ValueError(
+            f"Unknown input schema '{name}' for {data_type}, expected one of: "
+            f"{', '.join(sorted(schemas))}"
+        )
+    return schemas[name.lower()]
+
+
+def read_records(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        if Path(path).suffix.lower() in (".ndjson", ".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    return data if isinstance(data, list) else [data]
+
+
+def translate_file(
+    path: str,
+    data_type: str,
+    input_schema_name: Optional[str] = None,
+    errors: str = "raise",
+    max_errors: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Translates one input file. Runs in a worker process, so it takes and returns
+    only picklable values.
+    """
+    timings = dict.fromkeys(STAGES, 0.0)
+
+    start = time.perf_counter()
+    records = read_records(path)
+    timings["read"] = time.perf_counter() - start
+
+    result = {"path": path, "records": len(records), "rows": [], "timings": timings}
+    if not records:
+        return result
+
+    start = time.perf_counter()
+    translator = Translator(
+        data_type,
+        raw_data=records,
+        input_schema=resolve_input_schema(data_type, input_schema_name),
+    )
+    models = translator.translate(errors=errors, max_errors=max_errors)
+    timings["translate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result["rows"] = [model.model_dump() for model in models]
+    timings["serialize"] = time.perf_counter() - start
+
+    if models.error_report is not None:
+        result["error_report"] = models.error_report.model_dump()
+    return result
+
+
+class OutputWriter:
+    """
+    Streams translated rows to NDJSON, a JSON array, Parquet or Arrow IPC.
+    """
+
+    def __init__(self, path: Optional[str], output_format: str, data_type: str):
+        self.output_format = output_format
+        self._arrow_writer = None
+        self._file = None
+        self._first = True
+        if output_format in ("parquet", "arrow"):
+            if not path:
+                raise ValueError(f"--output is required for {output_format} output")
+            file_format = "parquet" if output_format == "parquet" else "ipc"
+            self._arrow_writer = ArrowModelListWriter(
+                path, mapping[data_type], file_format
+            )
+        else:
+            self._file = open(path, "w") if path else sys.stdout
+            if output_format == "json":
+                self._file.write("[")
+
+    def write(self, rows: List[Dict[str, Any]]):
+        if self._arrow_writer is not None:
+            self._arrow_writer.write(rows)
+            return
+        for row in rows:
+            line = json.dumps(row, default=str)
+            if self.output_format == "json":
+                line = ("\n  " if self._first else ",\n  ") + line
+                self._first = False
+            else:
+                line += "\n"
+            self._file.write(line)
+
+    def close(self):
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+            return
+        if self.output_format == "json":
+            self._file.write("\n]\n")
+        if self._file is not sys.stdout:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def abort(self):
+        """
+        Discards partial file output after a failure; stdout output cannot be undone.
+        """
+        if self._arrow_writer is not None:
+            self._arrow_writer.abort()
+        elif self._file is not sys.stdout:
+            self._file.close()
+            os.remove(self._file.name)
+
+
+def format_stats(results: List[Dict[str, Any]], elapsed: float, workers: int) -> str:
+    records = sum(result["records"] for result in results)
+    rows = [
+        [
+            stage,
+            f"{sum(result['timings'][stage] for result in results):.3f}",
+            _rate(records, sum(result["timings"][stage] for result in results)),
+        ]
+        for stage in STAGES
+    ]
+    rows.append(["wall clock", f"{elapsed:.3f}", _rate(records, elapsed)])
+    table = tabulate(rows, headers=["stage", "seconds", "records/s"], tablefmt="simple")
+    return (
+        f"{len(results)} files, {records} records, {workers} workers "
+        f"(stage seconds are summed across workers)\n\n{table}"
+    )
+
+
+def _rate(records: int, seconds: float) -> str:
+    return f"{records / seconds:,.0f}" if seconds else "-"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="net-model-translator",
+        description="Translate directories of parsed device output into structured models.",
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="JSON/NDJSON files, directories or glob patterns"
+    )
+    parser.add_argument(
+        "-t", "--data-type", required=True, choices=sorted(mapping), help="Data type"
+    )
+    parser.add_argument(
+        "-s",
+        "--input-schema",
+        help="Force an input schema by class name or 'package.module:ClassName'",
+    )
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(set(OUTPUT_FORMATS.values())),
+        help="Output format (default: inferred from --output, else ndjson)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--errors",
+        choices=("raise", "collect"),
+        default="raise",
+        help="Abort on the first invalid record, or drop and report invalid records",
+    )
+    parser.add_argument(
+        "--max-errors", type=int, help="Failed rows tolerated per file in collect mode"
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Print per-stage throughput to stderr"
+    )
+    return parser
+
+
+def worker_count(requested: int, paths: List[str]) -> int:
+    """
+    Returns the number of worker processes actually used; 1 means files are
+    translated in the current process.
+    """
+    return max(1, min(requested, len(paths)))
+
+
+def _results(
+    args: argparse.Namespace, paths: List[str], workers: int
+) -> Iterator[Dict[str, Any]]:
+    task_args = (args.data_type, args.input_schema, args.errors, args.max_errors)
+    if workers == 1:
+        for path in paths:
+            yield translate_file(path, *task_args)
+        return
+    # Keep a bounded window of files in flight so results stream out in input order
+    # without every translated file being held in memory at once.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append(executor.submit(translate_file, path, *task_args))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.max_errors is not None and args.errors != "collect":
+        parser.error("--max-errors requires --errors collect")
+    output_format = args.format or OUTPUT_FORMATS.get(
+        Path(args.output).suffix.lower() if args.output else "", "ndjson"
+    )
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("net-model-translator: no input files found", file=sys.stderr)
+        return 1
+
+    workers = worker_count(args.workers, paths)
+    start = time.perf_counter()
+    results = []
+    try:
+        resolve_input_schema(args.data_type, args.input_schema)
+        writer = OutputWriter(args.output, output_format, args.data_type)
+        try:
+            for result in _results(args, paths, workers):
+                write_start = time.perf_counter()
+                writer.write(result.pop("rows"))
+                result["timings"]["write"] = time.perf_counter() - write_start
+                results.append(result)
+                report = result.get("error_report")
+                if report and report["rows_failed"]:
+                    print(
+                        f"{result['path']}: {report['rows_failed']} of "
+                        f"{report['rows_processed']} rows failed"
+                        + (" (aborted)" if report["aborted"] else ""),
+                        file=sys.stderr,
+                    )
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close()
+    except (OSError, ValueError, ImportError) as e:
+        print(f"net-model-translator: {e}", file=sys.stderr)
+        return 1
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        print(format_stats(results, elapsed, workers), file=sys.stderr)
+    return 0
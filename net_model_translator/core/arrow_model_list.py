@@ -0,0 +1,383 @@
+# net_model_translator/core/arrow_model_list.py
+import bisect
+import ipaddress
+import itertools
+import json
+import os
+from pathlib import Path
+from typing import List, Dict, Any, Type, Optional, Iterator, Union, Callable
+
+from pydantic import BaseModel
+import pandas as pd
+
+from net_model_translator.core.indexes import encode_ip, encode_mac, encode_oui
+from net_model_translator.core.input_schema import InputSchema
+from net_model_translator.core.model_list import ModelList
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for disk-backed ModelLists: pip install pyarrow"
+        )
+
+
+def _file_format(path: Union[str, Path], file_format: Optional[str]) -> str:
+    if file_format:
+        if file_format not in ("ipc", "parquet"):
+            raise ValueError(f"Unsupported file format: {file_format}")
+        return file_format
+    suffix = Path(path).suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    if suffix in (".arrow", ".ipc", ".feather"):
+        return "ipc"
+    raise ValueError(
+        f"Cannot infer file format from '{path}', pass file_format='ipc' or 'parquet'."
+    )
+
+
+def _arrow_type(annotation: Any):
+    types = {str: pa.string(), int: pa.int64(), float: pa.float64(), bool: pa.bool_()}
+    args = [arg for arg in getattr(annotation, "__args__", ()) if arg is not type(None)]
+    if len(args) == 1:
+        annotation = args[0]
+    return types.get(annotation)
+
+
+# Holds every value without a typed column (extra fields and non-scalar model
+# fields) as a JSON object, so rows never have to share a set of extra keys.
+EXTRA_COLUMN = "__extra__"
+
+
+def _arrow_schema(model_cls: Type[BaseModel]):
+    """
+    Builds the Arrow schema for a model: one typed column per scalar model field,
+    plus the JSON-encoded EXTRA_COLUMN for everything else.
+    """
+    fields = []
+    for field_name, field_info in model_cls.__fields__.items():
+        arrow_type = _arrow_type(field_info.annotation)
+        if arrow_type is not None:
+            fields.append(pa.field(field_name, arrow_type))
+    fields.append(pa.field(EXTRA_COLUMN, pa.string()))
+    return pa.schema(fields)
+
+
+def _decode_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    extra = row.pop(EXTRA_COLUMN, None)
+    if extra:
+        row.update(json.loads(extra))
+    return row
+
+
+class ArrowModelListWriter:
+    """
+    Writes validated model rows to an Arrow IPC or Parquet file one chunk at a time.
+
+    Each call to `write` becomes one record batch (IPC) or row group (Parquet), which
+    is the unit an ArrowModelList loads when a row is touched. Data is written to a
+    temporary file that only replaces `path` when the writer closes without error,
+    so a failed translation never leaves a truncated snapshot behind.
+
+    Attributes:
+        path (str): The output file path.
+        model_cls (Type[BaseModel]): The Pydantic model class of the rows.
+        file_format (str): Either "ipc" or "parquet".
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        model_cls: Type[BaseModel],
+        file_format: Optional[str] = None,
+    ):
+        _require_pyarrow()
+        self.path = str(path)
+        self.model_cls = model_cls
+        self.file_format = _file_format(path, file_format)
+        self.rows_written = 0
+        self._schema = _arrow_schema(model_cls)
+        self._columns = [name for name in self._schema.names if name != EXTRA_COLUMN]
+        self._tmp_path = f"{self.path}.tmp"
+        if self.file_format == "parquet":
+            self._writer = pq.ParquetWriter(self._tmp_path, self._schema)
+        else:
+            self._writer = ipc.new_file(self._tmp_path, self._schema)
+
+    def _encode_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        encoded = {name: row.get(name) for name in self._columns}
+        extra = {key: value for key, value in row.items() if key not in encoded}
+        encoded[EXTRA_COLUMN] = json.dumps(extra, default=str) if extra else None
+        return encoded
+
+    def write(self, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        table = pa.Table.from_pylist(
+            [self._encode_row(row) for row in rows], schema=self._schema
+        )
+        self._writer.write_table(table)
+        self.rows_written += len(rows)
+
+    def close(self):
+        self._writer.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """
+        Discards everything written so far, leaving any existing file at `path` intact.
+        """
+        self._writer.close()
+        os.remove(self._tmp_path)
+
+    def __enter__(self) -> "ArrowModelListWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class ArrowModelList(ModelList):
+    """
+    A read-only ModelList backed by a memory-mapped Arrow IPC or Parquet file.
+
+    Opening only reads the file footer; rows are materialised into models when they
+    are indexed or iterated, one record batch (or row group) at a time.
+
+    Attributes:
+        path (str): The backing file path.
+        model_cls (Type[BaseModel]): The Pydantic model class.
+        input_schema_cls (Type[InputSchema]): The input schema class.
+        file_format (str): Either "ipc" or "parquet".
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        model_cls: Type[BaseModel],
+        input_schema_cls: Type[InputSchema] = InputSchema,
+        file_format: Optional[str] = None,
+    ):
+        """
+        Opens a disk-backed ModelList.
+
+        Args:
+            path (Union[str, Path]): The Arrow IPC or Parquet file to open.
+            model_cls (Type[BaseModel]): The Pydantic model class.
+            input_schema_cls (Type[InputSchema], optional): The input schema class.
+            file_format (Optional[str]): "ipc" or "parquet"; inferred from the suffix if omitted.
+        """
+        _require_pyarrow()
+        self.model_cls = model_cls
+        self.input_schema_cls = input_schema_cls
+        self.error_report = None
+        self.data_mapper = None
+        self._indexes = {}
+        self._fingerprints = {}
+        self._subscribers = []
+        self.path = str(path)
+        self.file_format = _file_format(path, file_format)
+        if self.file_format == "parquet":
+            self._source = pq.ParquetFile(self.path, memory_map=True)
+            schema = self._source.schema_arrow
+            metadata = self._source.metadata
+            row_counts = [
+                metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+            ]
+        else:
+            self._mmap = pa.memory_map(self.path, "r")
+            self._source = ipc.open_file(self._mmap)
+            schema = self._source.schema
+            row_counts = [
+                self._source.get_batch(i).num_rows
+                for i in range(self._source.num_record_batches)
+            ]
+        self._columns = set(schema.names) - {EXTRA_COLUMN}
+        self._offsets = list(itertools.accumulate(row_counts, initial=0))
+        self._cached_chunk = (None, None)
+
+    @classmethod
+    def open(
+        cls,
+        path: Union[str, Path],
+        model_cls: Type[BaseModel],
+        input_schema_cls: Type[InputSchema] = InputSchema,
+        file_format: Optional[str] = None,
+    ) -> "ArrowModelList":
+        return cls(path, model_cls, input_schema_cls, file_format)
+
+    def _num_chunks(self) -> int:
+        return len(self._offsets) - 1
+
+    def _read_chunk(self, chunk_index: int):
+        if self.file_format == "parquet":
+            return self._source.read_row_group(chunk_index)
+        return self._source.get_batch(chunk_index)
+
+    def _chunk(self, chunk_index: int):
+        cached_index, cached_chunk = self._cached_chunk
+        if cached_index != chunk_index:
+            cached_chunk = self._read_chunk(chunk_index)
+            self._cached_chunk = (chunk_index, cached_chunk)
+        return cached_chunk
+
+    def _locate(self, index: int):
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ArrowModelList index out of range")
+        chunk_index = bisect.bisect_right(self._offsets, index) - 1
+        return chunk_index, index - self._offsets[chunk_index]
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __getitem__(self, index: Union[int, slice]) -> BaseModel:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        chunk_index, row_index = self._locate(index)
+        row = self._chunk(chunk_index).slice(row_index, 1).to_pylist()[0]
+        return self.model_cls(**_decode_row(row))
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        for chunk_index in range(self._num_chunks()):
+            for row in self._read_chunk(chunk_index).to_pylist():
+                yield self.model_cls(**_decode_row(row))
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "ArrowModelList is read-only; copy it into a ModelList to modify it"
+        )
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    insert = _read_only
+    sort_by = _read_only
+    create_index = _read_only
+    apply_update = _read_only
+
+    def filter(self, **kwargs) -> ModelList:
+        """
+        Filters rows by field equality using Arrow compute, one chunk at a time.
+        Filters on fields without a typed column, or with values Arrow cannot compare
+        to the column type, fall back to comparing models.
+
+        Returns:
+            ModelList: An in-memory ModelList of the matching rows.
+        """
+        if not set(kwargs) <= self._columns:
+            return super().filter(**kwargs)
+
+        rows = []
+        for chunk_index in range(self._num_chunks()):
+            chunk = self._read_chunk(chunk_index)
+            mask = None
+            for field, value in kwargs.items():
+                column = chunk.column(field)
+                try:
+                    condition = (
+                        pc.is_null(column) if value is None else pc.equal(column, value)
+                    )
+                except (
+                    pa.ArrowNotImplementedError,
+                    pa.ArrowInvalid,
+                    pa.ArrowTypeError,
+                ):
+                    return super().filter(**kwargs)
+                mask = condition if mask is None else pc.and_(mask, condition)
+            if mask is not None:
+                chunk = chunk.filter(mask)
+            rows.extend(_decode_row(row) for row in chunk.to_pylist())
+        return ModelList(self.model_cls, self.input_schema_cls, *rows)
+
+    def _scan(self, field: str, match: Callable[[Any], Optional[int]]) -> ModelList:
+        """
+        Streams over `field` and materialises only the rows for which `match`
+        returns a sort key, returning them sorted by that key.
+        """
+        found = []
+        for chunk_index in range(self._num_chunks()):
+            chunk = self._read_chunk(chunk_index)
+            if field in self._columns:
+                for row_index, value in enumerate(chunk.column(field).to_pylist()):
+                    sort_key = match(value)
+                    if sort_key is not None:
+                        row = chunk.slice(row_index, 1).to_pylist()[0]
+                        found.append((sort_key, self.model_cls(**_decode_row(row))))
+            else:
+                for row in chunk.to_pylist():
+                    item = self.model_cls(**_decode_row(row))
+                    sort_key = match(getattr(item, field, None))
+                    if sort_key is not None:
+                        found.append((sort_key, item))
+        found.sort(key=lambda pair: pair[0])
+        return ModelList(
+            self.model_cls, self.input_schema_cls, *[item for _, item in found]
+        )
+
+    def in_subnet(self, field: str, network: str) -> ModelList:
+        """
+        Returns the rows whose address `field` lies within `network`, sorted by
+        address. A disk-backed list keeps no indexes, so this scans the column.
+        """
+        network = ipaddress.ip_network(network, strict=False)
+        low, high = int(network.network_address), int(network.broadcast_address)
+
+        def match(value: Any) -> Optional[int]:
+            key = encode_ip(value)
+            if key is not None and key[0] == network.version and low <= key[1] <= high:
+                return key[1]
+            return None
+
+        return self._scan(field, match)
+
+    def with_oui(self, field: str, oui: str) -> ModelList:
+        """
+        Returns the rows whose MAC address `field` has the given OUI, sorted by MAC
+        address. A disk-backed list keeps no indexes, so this scans the column.
+        """
+        oui_code = encode_oui(oui)
+
+        def match(value: Any) -> Optional[int]:
+            code = encode_mac(value)
+            return code if code is not None and code >> 24 == oui_code else None
+
+        return self._scan(field, match)
+
+    def to_pandas(self) -> pd.DataFrame:
+        if self.file_format == "parquet":
+            df = self._source.read().to_pandas()
+        else:
+            df = self._source.read_all().to_pandas()
+        extras = df.pop(EXTRA_COLUMN)
+        if extras.notna().any():
+            decoded = [
+                json.loads(extra) if isinstance(extra, str) else {} for extra in extras
+            ]
+            df = df.join(pd.DataFrame(decoded, index=df.index))
+        return df
+
+    def close(self):
+        self._cached_chunk = (None, None)
+        if self.file_format == "parquet":
+            self._source.close()
+        else:
+            self._mmap.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"ArrowModelList({self.model_cls.__name__}, {len(self)} items, {self.path})"
+        )
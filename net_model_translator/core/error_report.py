@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, List, Optional, Union
+from pydantic import BaseModel, ValidationError
+from tabulate import tabulate
+
+
+class TransformError(ValueError):
+    """
+    Raised when a Mapping transform fails on a raw value.
+
+    Attributes:
+        field (str): The target field being mapped.
+        value (Any): The raw source value passed to the transform.
+        error (Exception): The exception raised by the transform.
+    """
+
+    def __init__(self, field: str, value: Any, error: Exception):
+        super().__init__(
+            f"Transform for '{field}' failed on {value!r}: "
+            f"{type(error).__name__}: {error}"
+        )
+        self.field = field
+        self.value = value
+        self.error = error
+
+
+class RowError(BaseModel):
+    """
+    A single field-level failure encountered while translating a raw record.
+
+    Attributes:
+        row_index (int): The position of the record in the raw data.
+        field (Optional[str]): The model field that failed, if it could be determined.
+        value (Any): The raw value read from the record for that field.
+        message (str): The validation or transformation error message.
+        input_schema (str): The name of the input schema used for mapping.
+    """
+
+    row_index: int
+    field: Optional[str] = None
+    value: Any = None
+    message: str
+    input_schema: str
+
+
+class ErrorReport(BaseModel):
+    """
+    Collects row errors for a translation run in `errors="collect"` mode.
+
+    Attributes:
+        input_schema (str): The name of the input schema used for mapping.
+        max_errors (Optional[int]): The number of failed rows tolerated before aborting.
+        rows_processed (int): The number of raw records examined.
+        rows_failed (int): The number of raw records that were dropped.
+        aborted (bool): Whether translation stopped early because the budget was exceeded.
+        errors (List[RowError]): The individual field errors.
+    """
+
+    input_schema: str
+    max_errors: Optional[int] = None
+    rows_processed: int = 0
+    rows_failed: int = 0
+    aborted: bool = False
+    errors: List[RowError] = []
+
+    def record(
+        self,
+        row_index: int,
+        raw_data: Dict[str, Any],
+        error: Union[ValidationError, TransformError],
+        source_key_for: Callable[[str], str],
+    ):
+        """
+        Records a failed row and marks the report as aborted once the error budget is spent.
+
+        Args:
+            row_index (int): The position of the record in the raw data.
+            raw_data (Dict[str, Any]): The raw record that failed.
+            error (Union[ValidationError, TransformError]): The row's error.
+            source_key_for (Callable[[str], str]): Resolves a model field to its raw key.
+        """
+        if isinstance(error, ValidationError):
+            for detail in error.errors():
+                field = str(detail["loc"][0]) if detail["loc"] else None
+                self.errors.append(
+                    RowError(
+                        row_index=row_index,
+                        field=field,
+                        value=raw_data.get(source_key_for(field)) if field else None,
+                        message=detail["msg"],
+                        input_schema=self.input_schema,
+                    )
+                )
+        elif isinstance(error, TransformError):
+            self.errors.append(
+                RowError(
+                    row_index=row_index,
+                    field=error.field,
+                    value=error.value,
+                    message=f"{type(error.error).__name__}: {error.error}",
+                    input_schema=self.input_schema,
+                )
+            )
+        else:
+            raise TypeError(f"Cannot record {type(error).__name__} as a row error")
+        self.rows_failed += 1
+        if self.max_errors is not None and self.rows_failed > self.max_errors:
+            self.aborted = True
+
+    def to_table(self) -> str:
+        """
+        Generates a tabulated representation of the collected errors.
+
+        Returns:
+            str: A string representing the ErrorReport in tabular form.
+        """
+        summary = (
+            f"ErrorReport({self.input_schema}): {self.rows_failed} of "
+            f"{self.rows_processed} rows failed"
+            + (" (aborted: error budget exceeded)" if self.aborted else "")
+        )
+        if not self.errors:
+            return summary
+
+        headers = ["row_index", "field", "value", "message"]
+        rows = [[getattr(error, field) for field in headers] for error in self.errors]
+        table = tabulate(rows, headers=headers, tablefmt="fancy_grid")
+        return f"{summary}\n\n{table}"
+
+    def __len__(self) -> int:
+        return len(self.errors)
@@ -0,0 +1,260 @@
+from array import array
+import bisect
+import ipaddress
+import socket
+import string
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from pydantic import BaseModel
+
+
+class FieldIndex:
+    """
+    A hash index from field values to the models holding them.
+
+    Indexes hold model objects rather than positions, so they stay valid when rows
+    are inserted or removed elsewhere in the ModelList.
+
+    Attributes:
+        field (Union[str, Tuple[str, ...]]): The indexed field, or a tuple of fields
+            for a composite key.
+    """
+
+    def __init__(self, field: Union[str, Tuple[str, ...]]):
+        self.field = field
+        self._buckets: Dict[Any, Dict[int, BaseModel]] = {}
+
+    def key_of(self, item: BaseModel) -> Any:
+        if isinstance(self.field, tuple):
+            return tuple(getattr(item, field, None) for field in self.field)
+        return getattr(item, self.field, None)
+
+    def build(self, items: Iterable[BaseModel]):
+        for item in items:
+            self.add(item)
+
+    def add(self, item: BaseModel):
+        self._buckets.setdefault(self.key_of(item), {})[id(item)] = item
+
+    def remove(self, item: BaseModel):
+        key = self.key_of(item)
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.pop(id(item), None)
+            if not bucket:
+                del self._buckets[key]
+
+    def lookup(self, value: Any) -> List[BaseModel]:
+        return list(self._buckets.get(value, {}).values())
+
+    def keys(self) -> List[Any]:
+        return list(self._buckets)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._buckets
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+_MAC_SEPARATORS = str.maketrans("", "", ".:-")
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def encode_ip(value: Any) -> Optional[Tuple[int, int]]:
+    """
+    Encodes an IPv4 or IPv6 address string as (version, integer), or None if the
+    value is not an address.
+    """
+    if not isinstance(value, str):
+        return None
+    for family, version in ((socket.AF_INET, 4), (socket.AF_INET6, 6)):
+        try:
+            return version, int.from_bytes(socket.inet_pton(family, value), "big")
+        except OSError:
+            continue
+    return None
+
+
+def encode_mac(value: Any) -> Optional[int]:
+    """
+    Encodes a MAC address in any of the common notations ("0011.2233.4455",
+    "00:11:22:33:44:55", "00-11-22-33-44-55") as a 48-bit integer, or None.
+    """
+    if not isinstance(value, str):
+        return None
+    digits = value.translate(_MAC_SEPARATORS)
+    if len(digits) != 12 or not _HEX_DIGITS.issuperset(digits):
+        return None
+    return int(digits, 16)
+
+
+def encode_oui(oui: str) -> int:
+    """
+    Encodes an OUI such as "00:1a:2b" or "001a.2b" as a 24-bit integer.
+
+    Raises:
+        ValueError: If `oui` is not six hex digits.
+    """
+    digits = oui.translate(_MAC_SEPARATORS)
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):
+        raise ValueError(f"Invalid OUI: {oui}")
+    return int(digits, 16)
+
+
+class _SortedCodes:
+    """
+    Parallel sorted arrays of integer-encoded addresses and the models holding them.
+    """
+
+    def __init__(self, typecode: Optional[str] = None):
+        self._typecode = typecode
+        self.codes = array(typecode) if typecode else []
+        self.items: List[BaseModel] = []
+
+    def build(self, pairs: List[Tuple[int, BaseModel]]):
+        pairs.sort(key=lambda pair: pair[0])
+        codes = [code for code, _ in pairs]
+        self.codes = array(self._typecode, codes) if self._typecode else codes
+        self.items = [item for _, item in pairs]
+
+    def add(self, code: int, item: BaseModel):
+        position = bisect.bisect_right(self.codes, code)
+        self.codes.insert(position, code)
+        self.items.insert(position, item)
+
+    def remove(self, code: int, item: BaseModel):
+        low = bisect.bisect_left(self.codes, code)
+        high = bisect.bisect_right(self.codes, code)
+        for position in range(low, high):
+            if self.items[position] is item:
+                del self.codes[position]
+                del self.items[position]
+                return
+
+    def range(self, low: int, high: int) -> List[BaseModel]:
+        return self.items[
+            bisect.bisect_left(self.codes, low) : bisect.bisect_right(self.codes, high)
+        ]
+
+
+class IPAddressIndex:
+    """
+    A sorted index of IP address fields for exact, range and subnet queries.
+
+    Addresses are encoded once as integers; IPv4 codes live in a compact unsigned
+    32-bit array and IPv6 codes in a sorted list, so a subnet query is two binary
+    searches and a slice. Values that are not IP addresses are not indexed.
+
+    Attributes:
+        field (str): The indexed field.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self._stores = {4: _SortedCodes("I"), 6: _SortedCodes()}
+
+    def key_of(self, item: BaseModel) -> Optional[Tuple[int, int]]:
+        return encode_ip(getattr(item, self.field, None))
+
+    def build(self, items: Iterable[BaseModel]):
+        pairs = {4: [], 6: []}
+        for item in items:
+            key = self.key_of(item)
+            if key is not None:
+                pairs[key[0]].append((key[1], item))
+        for version, store in self._stores.items():
+            store.build(pairs[version])
+
+    def add(self, item: BaseModel):
+        key = self.key_of(item)
+        if key is not None:
+            self._stores[key[0]].add(key[1], item)
+
+    def remove(self, item: BaseModel):
+        key = self.key_of(item)
+        if key is not None:
+            self._stores[key[0]].remove(key[1], item)
+
+    def lookup(self, value: Any) -> List[BaseModel]:
+        key = encode_ip(value)
+        if key is None:
+            return []
+        return self._stores[key[0]].range(key[1], key[1])
+
+    def range(self, start: str, end: str) -> List[BaseModel]:
+        """
+        Returns the models whose address lies between `start` and `end` inclusive.
+        """
+        low, high = ipaddress.ip_address(start), ipaddress.ip_address(end)
+        if low.version != high.version:
+            raise ValueError(f"Mismatched address versions: {start}, {end}")
+        return self._stores[low.version].range(int(low), int(high))
+
+    def subnet(self, network: str) -> List[BaseModel]:
+        """
+        Returns the models whose address lies within `network` (e.g. "10.20.0.0/16").
+        """
+        network = ipaddress.ip_network(network, strict=False)
+        return self._stores[network.version].range(
+            int(network.network_address), int(network.broadcast_address)
+        )
+
+    def __len__(self) -> int:
+        return sum(len(store.items) for store in self._stores.values())
+
+
+class MACAddressIndex(FieldIndex):
+    """
+    A hash index of MAC address fields keyed by the 48-bit integer encoding, with
+    models also bucketed by OUI (the top 24 bits) for vendor queries.
+
+    Attributes:
+        field (str): The indexed field.
+    """
+
+    def __init__(self, field: str):
+        super().__init__(field)
+        self._ouis: Dict[int, Dict[int, BaseModel]] = {}
+
+    def key_of(self, item: BaseModel) -> Optional[int]:
+        return encode_mac(getattr(item, self.field, None))
+
+    def add(self, item: BaseModel):
+        key = self.key_of(item)
+        if key is not None:
+            self._buckets.setdefault(key, {})[id(item)] = item
+            self._ouis.setdefault(key >> 24, {})[id(item)] = item
+
+    def remove(self, item: BaseModel):
+        key = self.key_of(item)
+        if key is None:
+            return
+        for buckets, bucket_key in ((self._buckets, key), (self._ouis, key >> 24)):
+            bucket = buckets.get(bucket_key)
+            if bucket is not None:
+                bucket.pop(id(item), None)
+                if not bucket:
+                    del buckets[bucket_key]
+
+    def lookup(self, value: Any) -> List[BaseModel]:
+        return super().lookup(encode_mac(value))
+
+    def keys(self) -> List[str]:
+        return [
+            ":".join(f"{code:012x}"[i : i + 2] for i in range(0, 12, 2))
+            for code in self._buckets
+        ]
+
+    def __contains__(self, value: Any) -> bool:
+        return encode_mac(value) in self._buckets
+
+    def oui(self, oui: str) -> List[BaseModel]:
+        """
+        Returns the models whose MAC address has the given OUI, e.g. "00:1a:2b",
+        sorted by MAC address.
+        """
+        bucket = self._ouis.get(encode_oui(oui), {})
+        return sorted(bucket.values(), key=self.key_of)
+
+
+INDEX_KINDS = {"hash": FieldIndex, "ip": IPAddressIndex, "mac": MACAddressIndex}
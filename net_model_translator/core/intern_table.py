@@ -0,0 +1,82 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+
+class InternTable:
+    """
+    A bounded, least-recently-used table of canonical values.
+
+    Interning a value returns the first equal value seen, so repeated strings such as
+    platforms or interface names share a single object across models. The table is
+    bounded so that high-cardinality fields cannot grow it without limit, and is
+    safe to share between threads.
+
+    Attributes:
+        max_size (int): The maximum number of distinct values retained.
+        hits (int): The number of lookups that returned an existing value.
+        misses (int): The number of lookups that added a new value.
+        bytes_saved (int): The size of the duplicate objects that were replaced.
+    """
+
+    def __init__(self, max_size: int = 65536):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._values: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def intern(self, value: Any) -> Any:
+        """
+        Returns the canonical object equal to `value`, adding it if it is new.
+        Unhashable values are returned unchanged.
+        """
+        key = (type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return value
+        with self._lock:
+            canonical = self._values.get(key)
+            if canonical is None:
+                self.misses += 1
+                self._values[key] = value
+                if len(self._values) > self.max_size:
+                    self._values.popitem(last=False)
+                return value
+            self._values.move_to_end(key)
+            self.hits += 1
+            if canonical is not value:
+                self.bytes_saved += sys.getsizeof(value)
+            return canonical
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retrieves usage statistics for the table.
+
+        Returns:
+            Dict[str, int]: The table size, bound, hits, misses and bytes saved.
+        """
+        with self._lock:
+            return {
+                "size": len(self._values),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_saved": self.bytes_saved,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.hits = self.misses = self.bytes_saved = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+# Shared by every DataMapper that does not supply its own table, so values are
+# deduplicated across translations in a long-running process.
+default_intern_table = InternTable()
@@ -6,6 +6,7 @@ class Mapping(BaseModel):
     source_key: Optional[str] = None
     target_key: Optional[str] = None
     transform: Optional[Callable[[Any], Any]] = None  # Optional transformation function
+    intern: bool = False  # Share repeated values through the DataMapper's InternTable
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -1,11 +1,49 @@
 from collections.abc import MutableSequence
-from typing import List, Dict, Any, Type, Optional, Iterator
-from pydantic import BaseModel
+from typing import (
+    List,
+    Dict,
+    Any,
+    Type,
+    Optional,
+    Iterator,
+    Callable,
+    Sequence,
+    Tuple,
+    Union,
+)
+from pydantic import BaseModel, ConfigDict
+import hashlib
 import pandas as pd
 from tabulate import tabulate
 import json
 import yaml
 from net_model_translator.core.input_schema import InputSchema
+from net_model_translator.core.error_report import ErrorReport
+from net_model_translator.core.indexes import (
+    INDEX_KINDS,
+    FieldIndex,
+    IPAddressIndex,
+    MACAddressIndex,
+)
+
+
+class ModelListEvent(BaseModel):
+    """
+    A change applied to a ModelList by `apply_update`.
+
+    Attributes:
+        kind (str): One of "added", "removed" or "changed".
+        key (Any): The key of the affected row.
+        old (Any): The model before the change, or None when added.
+        new (Any): The model after the change, or None when removed.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    kind: str
+    key: Any
+    old: Any = None
+    new: Any = None
 
 
 class ModelList(MutableSequence):
@@ -16,6 +54,10 @@ class ModelList(MutableSequence):
     Attributes:
         model_cls (Type[BaseModel]): The Pydantic model class.
         input_schema_cls (Type[InputSchema]): The input schema class.
+        error_report (Optional[ErrorReport]): Rows dropped by a Translator in
+            errors="collect" mode, or None.
+        data_mapper (Optional[DataMapper]): The mapper used by `apply_update`; set by
+            the Translator that produced the list.
     """
 
     def __init__(
@@ -34,6 +76,11 @@ class ModelList(MutableSequence):
         """
         self.model_cls = model_cls
         self.input_schema_cls = input_schema_cls
+        self.error_report: Optional[ErrorReport] = None
+        self.data_mapper = None
+        self._indexes: Dict[Tuple[str, Any], Any] = {}
+        self._fingerprints: Dict[Any, Tuple[str, Any, BaseModel]] = {}
+        self._subscribers: List[Callable[[ModelListEvent], None]] = []
         self._list = []
         self.extend(args)
 
@@ -46,23 +93,96 @@ class ModelList(MutableSequence):
     def __setitem__(self, index: int, value: Dict[str, Any]):
         if not isinstance(value, self.model_cls):
             value = self.model_cls(**value)
+        self._index_remove(self._list[index])
         self._list[index] = value
+        self._index_add(value)
 
     def __delitem__(self, index: int):
+        removed = self._list[index]
+        for item in removed if isinstance(index, slice) else [removed]:
+            self._index_remove(item)
         del self._list[index]
 
     def insert(self, index: int, value: Dict[str, Any]):
         if not isinstance(value, self.model_cls):
             value = self.model_cls(**value)
         self._list.insert(index, value)
+        self._index_add(value)
 
     def __iter__(self) -> Iterator[BaseModel]:
         return iter(self._list)
 
+    def _index_add(self, item: BaseModel):
+        for index in self._indexes.values():
+            index.add(item)
+
+    def _index_remove(self, item: BaseModel):
+        for index in self._indexes.values():
+            index.remove(item)
+
+    def create_index(
+        self, field: Union[str, Sequence[str]], kind: str = "hash"
+    ) -> Union[FieldIndex, IPAddressIndex, MACAddressIndex]:
+        """
+        Creates (or returns the existing) index on a field and keeps it up to date
+        through every mutation.
+
+        Args:
+            field (Union[str, Sequence[str]]): The field, or fields for a composite hash key.
+            kind (str): "hash" for equality lookups used by `filter` and `find`, "ip"
+                for address/subnet queries, or "mac" for MAC and OUI queries.
+
+        Returns:
+            The index object.
+        """
+        if kind not in INDEX_KINDS:
+            raise ValueError(f"Unsupported index kind: {kind}")
+        field = field if isinstance(field, str) else tuple(field)
+        if (kind, field) not in self._indexes:
+            index = INDEX_KINDS[kind](field)
+            index.build(self._list)
+            self._indexes[(kind, field)] = index
+        return self._indexes[(kind, field)]
+
+    def drop_index(self, field: Union[str, Sequence[str]], kind: str = "hash"):
+        field = field if isinstance(field, str) else tuple(field)
+        self._indexes.pop((kind, field), None)
+
+    def _candidates(self, kwargs: Dict[str, Any]) -> Iterator[BaseModel]:
+        # Indexes only narrow the search; rows are still yielded in list order.
+        for field, value in kwargs.items():
+            index = self._indexes.get(("hash", field))
+            if index is not None:
+                matches = index.lookup(value)
+                if len(matches) <= 1:
+                    return iter(matches)
+                ids = {id(item) for item in matches}
+                return (item for item in self._list if id(item) in ids)
+        return iter(self)
+
+    def in_subnet(self, field: str, network: str) -> "ModelList":
+        """
+        Returns the rows whose address `field` lies within `network`, e.g.
+        `arp.in_subnet("address", "10.20.0.0/16")`, using (and creating on first
+        use) an "ip" index on the field. Unlike `filter`, rows come back sorted by
+        address rather than in list order, which keeps the query a slice of the index.
+        """
+        items = self.create_index(field, kind="ip").subnet(network)
+        return ModelList(self.model_cls, self.input_schema_cls, *items)
+
+    def with_oui(self, field: str, oui: str) -> "ModelList":
+        """
+        Returns the rows whose MAC address `field` has the given OUI, using (and
+        creating on first use) a "mac" index on the field. Rows come back sorted by
+        MAC address, like `in_subnet`.
+        """
+        items = self.create_index(field, kind="mac").oui(oui)
+        return ModelList(self.model_cls, self.input_schema_cls, *items)
+
     def filter(self, **kwargs) -> "ModelList":
         filtered_items = [
             item
-            for item in self._list
+            for item in self._candidates(kwargs)
             if all(getattr(item, k) == v for k, v in kwargs.items())
         ]
         return ModelList(
@@ -72,13 +192,141 @@ class ModelList(MutableSequence):
         )
 
     def find(self, **kwargs) -> Optional[BaseModel]:
-        for item in self._list:
+        for item in self._candidates(kwargs):
             if all(getattr(item, k) == v for k, v in kwargs.items()):
                 return item
         return None
 
+    def subscribe(self, callback: Callable[[ModelListEvent], None]):
+        """
+        Registers a callback that receives a ModelListEvent for every row added,
+        removed or changed by `apply_update`.
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[ModelListEvent], None]):
+        self._subscribers.remove(callback)
+
+    @staticmethod
+    def _fingerprint(raw_data: Dict[str, Any]) -> str:
+        encoded = json.dumps(raw_data, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def apply_update(
+        self,
+        new_raw_records: List[Dict[str, Any]],
+        key: Union[str, Sequence[str]],
+    ) -> List[ModelListEvent]:
+        """
+        Brings the list in line with a fresh poll of raw records.
+
+        Raw records are fingerprinted and only those that are new, whose fingerprint
+        changed, or whose row was replaced since the last update are mapped and
+        validated. Rows are matched on the
+        validated key, so keys coerced by the model compare correctly. Rows whose key
+        is absent from `new_raw_records` are removed, as are any extra rows sharing a
+        key. Indexes are updated in place and an event is sent to subscribers for each
+        added, removed or changed row.
+
+        Args:
+            new_raw_records (List[Dict[str, Any]]): The complete current set of raw records.
+            key (Union[str, Sequence[str]]): The model field(s) identifying a row.
+
+        Returns:
+            List[ModelListEvent]: The changes that were applied.
+
+        Raises:
+            ValueError: If two records in `new_raw_records` share a key.
+        """
+        if self.data_mapper is None:
+            from net_model_translator.core.translator import DataMapper
+
+            self.data_mapper = DataMapper(self.input_schema_cls)
+        key_index = self.create_index(key)
+
+        def raw_key(data: Dict[str, Any]) -> Any:
+            if isinstance(key_index.field, str):
+                return self.data_mapper.map_value(data, key_index.field)
+            return tuple(self.data_mapper.map_value(data, f) for f in key_index.field)
+
+        # Resolve every record to its validated key before touching the list, so a
+        # duplicate key leaves the list unchanged.
+        # A fingerprint only vouches for the exact model it produced; if that row was
+        # replaced or removed directly, the record is validated again.
+        incoming: Dict[
+            Any, Tuple[Optional[BaseModel], Optional[BaseModel], Any, str]
+        ] = {}
+        for data in new_raw_records:
+            row_raw_key = raw_key(data)
+            fingerprint = self._fingerprint(data)
+            previous = self._fingerprints.get(row_raw_key)
+            if (
+                previous
+                and previous[0] == fingerprint
+                and any(item is previous[2] for item in key_index.lookup(previous[1]))
+            ):
+                row_key, new, kept = previous[1], None, previous[2]
+            else:
+                new = self.model_cls(**self.data_mapper.apply_mappings(data))
+                row_key, kept = key_index.key_of(new), None
+            if row_key in incoming:
+                raise ValueError(f"Duplicate key {row_key!r} in new_raw_records")
+            incoming[row_key] = (new, kept, row_raw_key, fingerprint)
+
+        events = []
+        replacements = {}
+        removed = {}
+        added = []
+        fingerprints = {}
+        for row_key, (new, kept, row_raw_key, fingerprint) in incoming.items():
+            existing = key_index.lookup(row_key)
+            if not existing:
+                added.append(new)
+                events.append(ModelListEvent(kind="added", key=row_key, new=new))
+                fingerprints[row_raw_key] = (fingerprint, row_key, new)
+                continue
+            current = kept if kept is not None else existing[0]
+            duplicates = [item for item in existing if item is not current]
+            if new is not None and current != new:
+                replacements[id(current)] = new
+                event = ModelListEvent(
+                    kind="changed", key=row_key, old=current, new=new
+                )
+                events.append(event)
+                current = new
+            fingerprints[row_raw_key] = (fingerprint, row_key, current)
+            for item in duplicates:
+                removed[id(item)] = item
+                events.append(ModelListEvent(kind="removed", key=row_key, old=item))
+        for row_key in key_index.keys():
+            if row_key not in incoming:
+                for item in key_index.lookup(row_key):
+                    removed[id(item)] = item
+                    events.append(ModelListEvent(kind="removed", key=row_key, old=item))
+
+        if replacements or removed:
+            for item in removed.values():
+                self._index_remove(item)
+            for position, item in enumerate(self._list):
+                if id(item) in replacements:
+                    self._index_remove(item)
+                    self._list[position] = replacements[id(item)]
+                    self._index_add(self._list[position])
+            if removed:
+                self._list = [item for item in self._list if id(item) not in removed]
+        for item in added:
+            self._list.append(item)
+            self._index_add(item)
+        self._fingerprints = fingerprints
+
+        for event in events:
+            for callback in list(self._subscribers):
+                callback(event)
+        return events
+
     def to_dict(self) -> List[Dict[str, Any]]:
-        return [item.dict() for item in self._list]
+        return [item.dict() for item in self]
 
     def to_pandas(self) -> pd.DataFrame:
         return pd.DataFrame(self.to_dict())
@@ -112,27 +360,27 @@ class ModelList(MutableSequence):
     def sum(self, field: str) -> float:
         return sum(
             getattr(item, field, 0)
-            for item in self._list
+            for item in self
             if isinstance(getattr(item, field, 0), (int, float))
         )
 
     def average(self, field: str) -> float:
         values = [
             getattr(item, field, 0)
-            for item in self._list
+            for item in self
             if isinstance(getattr(item, field, 0), (int, float))
         ]
         return sum(values) / len(values) if values else 0
 
     def count(self, field: str, value: Any) -> int:
-        return sum(1 for item in self._list if getattr(item, field) == value)
+        return sum(1 for item in self if getattr(item, field) == value)
 
     def sort_by(self, field: str, reverse: bool = False):
         self._list.sort(key=lambda item: getattr(item, field), reverse=reverse)
 
     def group_by(self, field: str) -> Dict[Any, "ModelList"]:
         groups = {}
-        for item in self._list:
+        for item in self:
             key = getattr(item, field)
             if key not in groups:
                 groups[key] = []
@@ -162,11 +410,11 @@ class ModelList(MutableSequence):
         Returns:
             str: A string representing the ModelList in tabular form.
         """
-        if not self._list:
+        if not len(self):
             return f"ModelList({self.model_cls.__name__}): []"
 
         headers = list(self.model_cls.__fields__.keys())
-        rows = [[getattr(item, field) for field in headers] for item in self._list]
+        rows = [[getattr(item, field) for field in headers] for item in self]
 
         table = tabulate(
             rows,
@@ -181,7 +429,7 @@ class ModelList(MutableSequence):
         return result
 
     def __repr__(self) -> str:
-        return f"ModelList({self.model_cls.__name__}, {len(self._list)} items)"
+        return f"ModelList({self.model_cls.__name__}, {len(self)} items)"
 
     def __str__(self) -> str:
         return self.__repr__()
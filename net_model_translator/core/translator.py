@@ -1,11 +1,19 @@
 # net_model_translator/core/translator.py
-from typing import List, Dict, Any, Type, Optional
-from pydantic import BaseModel
+import itertools
+from pathlib import Path
+from typing import List, Dict, Any, Type, Optional, Iterable, Union
+from pydantic import BaseModel, ValidationError
 from net_model_translator.core.mapping import Mapping
 from net_model_translator.core.autodetect_schema import AutoDetectSchema
 from net_model_translator.core.input_schema import InputSchema
 from net_model_translator.models import mapping
 from net_model_translator.core.model_list import ModelList
+from net_model_translator.core.error_report import ErrorReport, TransformError
+from net_model_translator.core.intern_table import InternTable, default_intern_table
+from net_model_translator.core.arrow_model_list import (
+    ArrowModelList,
+    ArrowModelListWriter,
+)
 
 
 class SchemaDetector:
@@ -17,27 +25,58 @@ class SchemaDetector:
 
 
 class DataMapper:
-    def __init__(self, input_schema: Type[InputSchema]):
+    def __init__(
+        self,
+        input_schema: Type[InputSchema],
+        intern_fields: Optional[Iterable[str]] = None,
+        intern_table: Optional[InternTable] = None,
+    ):
         self.input_schema = input_schema
+        self.intern_table = (
+            intern_table if intern_table is not None else default_intern_table
+        )
+        self.intern_fields = set(intern_fields or ())
+        self.intern_fields.update(
+            mapping.target_key or field_name
+            for field_name, field_info in self.input_schema.__fields__.items()
+            for mapping in [field_info.default]
+            if isinstance(mapping, Mapping) and mapping.intern
+        )
 
     def apply_mappings(self, data: Dict[str, Any]) -> Dict[str, Any]:
         mapped_data = self._map_defined_fields(data)
         extra_fields = self._extract_extra_fields(data, mapped_data)
         mapped_data.update(extra_fields)
+        if self.intern_fields:
+            self._intern_values(mapped_data)
         return mapped_data
 
+    def _intern_values(self, mapped_data: Dict[str, Any]):
+        for key in self.intern_fields:
+            value = mapped_data.get(key)
+            if value is not None:
+                mapped_data[key] = self.intern_table.intern(value)
+
     def _map_defined_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
         mapped_data = {}
         for field_name, field_info in self.input_schema.__fields__.items():
             mapping: Mapping = field_info.default
             target_key = mapping.target_key or field_name
             source_key = mapping.source_key or field_name
-            value = data.get(source_key)
-            if value is not None and mapping.transform:
-                value = mapping.transform(value)
-            mapped_data[target_key] = value
+            mapped_data[target_key] = self._transform(
+                mapping, target_key, data.get(source_key)
+            )
         return mapped_data
 
+    @staticmethod
+    def _transform(mapping: Mapping, target_key: str, value: Any) -> Any:
+        if value is None or not mapping.transform:
+            return value
+        try:
+            return mapping.transform(value)
+        except Exception as e:
+            raise TransformError(target_key, value, e) from e
+
     def _extract_extra_fields(
         self, data: Dict[str, Any], mapped_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -53,6 +92,21 @@ class DataMapper:
             if key not in combined_schema_source_keys
         }
 
+    def map_value(self, data: Dict[str, Any], target_key: str) -> Any:
+        for field_name, field_info in self.input_schema.__fields__.items():
+            mapping: Mapping = field_info.default
+            if (mapping.target_key or field_name) == target_key:
+                value = data.get(mapping.source_key or field_name)
+                return self._transform(mapping, target_key, value)
+        return data.get(target_key)
+
+    def source_key_for(self, target_key: str) -> str:
+        for field_name, field_info in self.input_schema.__fields__.items():
+            mapping: Mapping = field_info.default
+            if (mapping.target_key or field_name) == target_key:
+                return mapping.source_key or field_name
+        return target_key
+
 
 class Translator:
     def __init__(
@@ -61,25 +115,115 @@ class Translator:
         model: Type[BaseModel] = None,
         raw_data: Optional[List[Dict[str, Any]]] = None,
         input_schema: Optional[Type[InputSchema]] = None,
+        intern_fields: Optional[Iterable[str]] = None,
+        intern_table: Optional[InternTable] = None,
     ):
         self.data_type = data_type
         self.model = model or mapping[data_type]
         self.raw_data = raw_data
         self.input_schema = input_schema or SchemaDetector.detect(raw_data, data_type)
-        self.data_mapper = DataMapper(self.input_schema)
+        self.data_mapper = DataMapper(self.input_schema, intern_fields, intern_table)
+
+    def translate(
+        self,
+        raw_data: Optional[List[Dict[str, Any]]] = None,
+        errors: str = "raise",
+        max_errors: Optional[int] = None,
+    ) -> ModelList:
+        """
+        Translates raw data into a ModelList.
 
-    def translate(self, raw_data: Optional[List[Dict[str, Any]]] = None) -> ModelList:
+        With errors="raise" the first invalid record raises. With errors="collect"
+        invalid records are dropped and described in the returned list's
+        `error_report`; translation stops early once more than `max_errors` rows fail.
+        """
         self.raw_data = raw_data or self.raw_data
         if not self.raw_data:
             raise ValueError(
                 "raw_data must be passed to translate() if not set in the constructor."
             )
 
-        validated_data = [
-            self.data_mapper.apply_mappings(data) for data in self.raw_data
-        ]
-        return ModelList(
+        report = self._error_report(errors, max_errors)
+        model_list = ModelList(
             self.model,
             self.data_mapper.input_schema,
-            *validated_data,
+            *self._translate_rows(self.raw_data, report),
         )
+        model_list.error_report = report
+        model_list.data_mapper = self.data_mapper
+        return model_list
+
+    def translate_to_file(
+        self,
+        path: Union[str, Path],
+        raw_data: Optional[Iterable[Dict[str, Any]]] = None,
+        chunk_size: int = 65536,
+        file_format: Optional[str] = None,
+        errors: str = "raise",
+        max_errors: Optional[int] = None,
+    ) -> ArrowModelList:
+        """
+        Translates raw data in chunks of `chunk_size` rows straight to an Arrow IPC or
+        Parquet file and returns a disk-backed ModelList over it. `raw_data` may be any
+        iterable, so the full inventory never has to be held in memory. `errors` and
+        `max_errors` behave as in translate().
+        """
+        source = raw_data or self.raw_data
+        if not source:
+            raise ValueError(
+                "raw_data must be passed to translate_to_file() if not set in the constructor."
+            )
+        # One-shot iterables are consumed here, so only keep lists for later calls.
+        if isinstance(raw_data, list):
+            self.raw_data = raw_data
+
+        report = self._error_report(errors, max_errors)
+        rows = iter(source)
+        offset = 0
+        with ArrowModelListWriter(path, self.model, file_format) as writer:
+            while not (report is not None and report.aborted):
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                models = self._translate_rows(chunk, report, offset)
+                writer.write([model.model_dump() for model in models])
+                offset += len(chunk)
+        model_list = ArrowModelList(
+            path, self.model, self.data_mapper.input_schema, writer.file_format
+        )
+        model_list.error_report = report
+        return model_list
+
+    def _error_report(
+        self, errors: str, max_errors: Optional[int]
+    ) -> Optional[ErrorReport]:
+        if errors == "raise":
+            return None
+        if errors == "collect":
+            return ErrorReport(
+                input_schema=self.data_mapper.input_schema.__name__,
+                max_errors=max_errors,
+            )
+        raise ValueError(f"errors must be 'raise' or 'collect', got '{errors}'")
+
+    def _translate_rows(
+        self,
+        raw_data: Iterable[Dict[str, Any]],
+        report: Optional[ErrorReport] = None,
+        start_index: int = 0,
+    ) -> List[BaseModel]:
+        if report is None:
+            return [
+                self.model(**self.data_mapper.apply_mappings(data)) for data in raw_data
+            ]
+
+        models = []
+        for row_index, data in enumerate(raw_data, start=start_index):
+            report.rows_processed += 1
+            try:
+                models.append(self.model(**self.data_mapper.apply_mappings(data)))
+            except (ValidationError, TransformError) as e:
+                report.record(row_index, data, e, self.data_mapper.source_key_for)
+            if report.aborted:
+                break
+        return models
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture
+def ios_cdp_records():
+    return [
+        {
+            "neighbor_name": f"IOS_Device_{i}",
+            "mgmt_address": f"192.168.1.{i}",
+            "local_interface": f"GigabitEthernet{i}/0/{i}",
+            "neighbor_interface": f"GigabitEthernet{i}/0/{i + 1}",
+            "platform": "Cisco IOS",
+            "capabilities": "Router",
+            "software_version": f"IOS Detail {i}",
+        }
+        for i in range(1, 11)
+    ]
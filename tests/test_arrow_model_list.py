@@ -0,0 +1,99 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from net_model_translator.core.arrow_model_list import (  # noqa: E402
+    ArrowModelList,
+    ArrowModelListWriter,
+)
+from net_model_translator.core.translator import Translator  # noqa: E402
+from net_model_translator.input_schemas.cdp_neighbors.ntc_templates import (  # noqa: E402
+    CiscoIOS,
+)
+
+
+@pytest.fixture(params=["snap.arrow", "snap.parquet"])
+def snapshot_path(request, tmp_path):
+    return tmp_path / request.param
+
+
+def test_round_trip_matches_in_memory_translation(ios_cdp_records, snapshot_path):
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+    expected = translator.translate().to_dict()
+
+    snapshot = translator.translate_to_file(snapshot_path, chunk_size=3)
+
+    assert isinstance(snapshot, ArrowModelList)
+    assert len(snapshot) == 10
+    assert snapshot._num_chunks() == 4
+    assert snapshot.to_dict() == expected
+    assert snapshot[4].model_dump() == expected[4]
+    assert snapshot[-1].model_dump() == expected[-1]
+    with pytest.raises(IndexError):
+        snapshot[10]
+
+
+def test_mixed_extras_survive_round_trip(ios_cdp_records, snapshot_path):
+    for i, record in enumerate(ios_cdp_records):
+        if i % 3 == 0:
+            record["extra"] = i
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+
+    snapshot = translator.translate_to_file(snapshot_path, chunk_size=4)
+
+    assert snapshot[9].extra == 9
+    assert not hasattr(snapshot[1], "extra")
+    df = snapshot.to_pandas()
+    assert "__extra__" not in df.columns
+    assert df["extra"].dropna().tolist() == [0, 3, 6, 9]
+
+
+def test_filter_matches_in_memory_semantics(ios_cdp_records, snapshot_path):
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+    snapshot = translator.translate_to_file(snapshot_path, chunk_size=3)
+
+    assert len(snapshot.filter(platform="Cisco IOS")) == 10
+    assert [row.ip_address for row in snapshot.filter(hostname="IOS_Device_5")] == [
+        "192.168.1.5"
+    ]
+    assert len(snapshot.filter(hostname=5)) == 0
+    assert len(snapshot.filter(hostname=None)) == 0
+
+
+def test_snapshot_is_read_only(ios_cdp_records, snapshot_path):
+    snapshot = Translator("cdp_neighbors", raw_data=ios_cdp_records).translate_to_file(
+        snapshot_path
+    )
+
+    with pytest.raises(TypeError):
+        snapshot[0] = ios_cdp_records[0]
+    with pytest.raises(TypeError):
+        del snapshot[0]
+
+
+def test_failed_translation_leaves_no_file(ios_cdp_records, snapshot_path):
+    ios_cdp_records[5]["neighbor_name"] = ["not", "a", "string"]
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+
+    with pytest.raises(ValueError):
+        translator.translate_to_file(snapshot_path, chunk_size=3)
+
+    assert list(snapshot_path.parent.iterdir()) == []
+
+
+def test_writer_with_no_rows_creates_empty_snapshot(tmp_path):
+    from net_model_translator.models import CDPNeighborsModel
+
+    path = tmp_path / "empty.arrow"
+    with ArrowModelListWriter(path, CDPNeighborsModel):
+        pass
+
+    assert len(ArrowModelList(path, CDPNeighborsModel, CiscoIOS)) == 0
+
+
+def test_one_shot_iterable_is_not_kept(ios_cdp_records, tmp_path):
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+
+    translator.translate_to_file(tmp_path / "snap.arrow", iter(ios_cdp_records))
+
+    assert len(translator.translate()) == 10
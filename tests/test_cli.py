@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from net_model_translator.cli import main, resolve_input_schema, worker_count
+
+
+@pytest.fixture
+def input_dir(tmp_path, ios_cdp_records):
+    directory = tmp_path / "parsed"
+    directory.mkdir()
+    (directory / "a.json").write_text(json.dumps(ios_cdp_records[:6]))
+    (directory / "b.ndjson").write_text(
+        "\n".join(json.dumps(record) for record in ios_cdp_records[6:])
+    )
+    (directory / "notes.txt").write_text("ignored")
+    return directory
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_ndjson_output_keeps_input_order(input_dir, tmp_path, workers):
+    output = tmp_path / "out.ndjson"
+
+    assert (
+        main([str(input_dir), "-t", "cdp_neighbors", "-o", str(output), "-w", workers])
+        == 0
+    )
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["hostname"] for row in rows] == [
+        f"IOS_Device_{i}" for i in range(1, 11)
+    ]
+
+
+def test_json_output_is_an_array(input_dir, tmp_path):
+    output = tmp_path / "out.json"
+
+    assert (
+        main([str(input_dir / "*.json"), "-t", "cdp_neighbors", "-o", str(output)]) == 0
+    )
+
+    assert len(json.loads(output.read_text())) == 6
+
+
+@pytest.mark.parametrize("suffix", ["parquet", "arrow"])
+def test_arrow_outputs(input_dir, tmp_path, suffix):
+    pytest.importorskip("pyarrow")
+    from net_model_translator.core.arrow_model_list import ArrowModelList
+    from net_model_translator.models import CDPNeighborsModel
+
+    output = tmp_path / f"out.{suffix}"
+
+    assert (
+        main([str(input_dir), "-t", "cdp_neighbors", "-o", str(output), "-w", "1"]) == 0
+    )
+
+    assert len(ArrowModelList(output, CDPNeighborsModel)) == 10
+
+
+def test_stats_report_workers_used(input_dir, tmp_path, capsys):
+    output = tmp_path / "out.ndjson"
+
+    main(
+        [
+            str(input_dir / "a.json"),
+            "-t",
+            "cdp_neighbors",
+            "-o",
+            str(output),
+            "-w",
+            "8",
+            "--stats",
+        ]
+    )
+
+    err = capsys.readouterr().err
+    assert "1 files, 6 records, 1 workers" in err
+    assert "translate" in err
+    assert worker_count(8, ["a", "b"]) == 2
+    assert worker_count(0, ["a"]) == 1
+
+
+def test_collect_mode_reports_failed_rows(tmp_path, ios_cdp_records, capsys):
+    ios_cdp_records[0]["neighbor_name"] = 1.5
+    source = tmp_path / "bad.json"
+    source.write_text(json.dumps(ios_cdp_records))
+    output = tmp_path / "out.ndjson"
+
+    args = [
+        str(source),
+        "-t",
+        "cdp_neighbors",
+        "-o",
+        str(output),
+        "--errors",
+        "collect",
+    ]
+    assert main(args) == 0
+
+    assert len(output.read_text().splitlines()) == 9
+    assert "1 of 10 rows failed" in capsys.readouterr().err
+
+
+def test_failed_run_removes_partial_output(tmp_path, ios_cdp_records, capsys):
+    ios_cdp_records[0]["neighbor_name"] = 1.5
+    source = tmp_path / "bad.json"
+    source.write_text(json.dumps(ios_cdp_records))
+    output = tmp_path / "out.ndjson"
+
+    assert main([str(source), "-t", "cdp_neighbors", "-o", str(output)]) == 1
+
+    assert not output.exists()
+    assert capsys.readouterr().err.startswith("net-model-translator: ")
+
+
+def test_max_errors_requires_collect(input_dir):
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(input_dir), "-t", "cdp_neighbors", "--max-errors", "3"])
+    assert excinfo.value.code == 2
+
+
+def test_forced_input_schema(input_dir, tmp_path, capsys):
+    output = tmp_path / "out.ndjson"
+    schema = "net_model_translator.input_schemas.cdp_neighbors.ntc_templates:CiscoIOS"
+
+    assert (
+        main([str(input_dir), "-t", "cdp_neighbors", "-s", schema, "-o", str(output)])
+        == 0
+    )
+    assert (
+        main(
+            [str(input_dir), "-t", "cdp_neighbors", "-s", "ciscoios", "-o", str(output)]
+        )
+        == 0
+    )
+
+    missing = "net_model_translator.input_schemas.cdp_neighbors.ntc_templates:Missing"
+    assert main([str(input_dir), "-t", "cdp_neighbors", "-s", missing]) == 1
+    assert "Missing" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        resolve_input_schema("cdp_neighbors", "nope")
@@ -0,0 +1,71 @@
+import pytest
+from pydantic import ValidationError
+
+from net_model_translator.core.error_report import TransformError
+from net_model_translator.core.translator import Translator
+from net_model_translator.input_schemas.arp.ntc_templates.cisco_ios import (
+    ARPInputSchema,
+)
+
+
+def test_collect_keeps_valid_rows_and_reports_bad_ones(ios_cdp_records):
+    ios_cdp_records[2]["neighbor_name"] = ["not", "a", "string"]
+    ios_cdp_records[4]["local_interface"] = 12
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+
+    models = translator.translate(errors="collect")
+
+    assert len(models) == 8
+    report = models.error_report
+    assert (report.rows_processed, report.rows_failed, report.aborted) == (10, 2, False)
+    validation_error, transform_error = report.errors
+    assert validation_error.row_index == 2
+    assert validation_error.field == "hostname"
+    assert validation_error.value == ["not", "a", "string"]
+    assert validation_error.input_schema == "CiscoIOS"
+    assert transform_error.row_index == 4
+    assert transform_error.field == "local_port"
+    assert transform_error.value == 12
+    assert "row_index" in report.to_table()
+
+
+def test_raise_mode_raises_on_first_bad_row(ios_cdp_records):
+    ios_cdp_records[2]["neighbor_name"] = ["not", "a", "string"]
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+
+    with pytest.raises(ValidationError):
+        translator.translate()
+
+    ios_cdp_records[2]["neighbor_name"] = "fixed"
+    ios_cdp_records[4]["local_interface"] = 12
+    with pytest.raises(TransformError) as excinfo:
+        translator.translate()
+    assert excinfo.value.field == "local_port"
+
+
+def test_error_budget_stops_early(ios_cdp_records):
+    for record in ios_cdp_records[1:]:
+        record["neighbor_name"] = 1.5
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+
+    models = translator.translate(errors="collect", max_errors=2)
+
+    assert len(models) == 1
+    assert models.error_report.aborted
+    assert models.error_report.rows_failed == 3
+    assert models.error_report.rows_processed == 4
+
+
+def test_schema_bugs_are_not_reported_as_bad_rows():
+    records = [{"address": "10.0.0.1", "mac": "0011.2233.4455", "interface": "Gi1"}]
+    translator = Translator("arp", raw_data=records, input_schema=ARPInputSchema)
+
+    with pytest.raises(AttributeError):
+        translator.translate(errors="collect")
+
+
+def test_unknown_errors_mode_is_rejected(ios_cdp_records):
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+
+    with pytest.raises(ValueError):
+        translator.translate(errors="ignore")
@@ -0,0 +1,140 @@
+import pytest
+
+from net_model_translator.core.indexes import (
+    IPAddressIndex,
+    MACAddressIndex,
+    encode_ip,
+    encode_mac,
+    encode_oui,
+)
+from net_model_translator.core.input_schema import InputSchema
+from net_model_translator.core.model_list import ModelList
+from net_model_translator.models.arp import ARPModel
+
+ARP_ROWS = [
+    {"address": "10.20.3.1", "mac": "001a.2b00.0003", "interface": "Vlan20"},
+    {"address": "10.30.0.1", "mac": "00:1a:2b:00:00:01", "interface": "Vlan30"},
+    {"address": "10.20.0.9", "mac": "aa-bb-cc-00-00-01", "interface": "Vlan20"},
+    {"address": "2001:db8::1", "mac": "001a.2b00.0002", "interface": "Vlan60"},
+    {"address": "incomplete", "mac": "incomplete", "interface": "Vlan99"},
+]
+
+
+def _addresses(items):
+    return [item.address for item in items]
+
+
+@pytest.fixture
+def arp():
+    return ModelList(ARPModel, InputSchema, *[ARPModel(**row) for row in ARP_ROWS])
+
+
+def test_encoders():
+    assert encode_ip("10.0.0.1") == (4, 0x0A000001)
+    assert encode_ip("::1") == (6, 1)
+    assert encode_ip("10.0.0.256") is None
+    assert encode_ip(None) is None
+    assert encode_mac("0011.2233.4455") == encode_mac("00-11-22-33-44-55")
+    assert encode_mac("0011.2233.44") is None
+    assert encode_oui("00:1a:2b") == encode_oui("001a.2b") == 0x001A2B
+    with pytest.raises(ValueError, match="Invalid OUI"):
+        encode_oui("00:1a:zz")
+
+
+def test_ip_index_queries(arp):
+    index = IPAddressIndex("address")
+    index.build(arp)
+
+    assert len(index) == 4
+    assert _addresses(index.subnet("10.20.0.0/16")) == ["10.20.0.9", "10.20.3.1"]
+    assert _addresses(index.range("10.20.0.0", "10.30.0.1")) == [
+        "10.20.0.9",
+        "10.20.3.1",
+        "10.30.0.1",
+    ]
+    assert _addresses(index.subnet("2001:db8::/32")) == ["2001:db8::1"]
+    assert _addresses(index.lookup("10.30.0.1")) == ["10.30.0.1"]
+    assert index.lookup("incomplete") == []
+    with pytest.raises(ValueError, match="Mismatched"):
+        index.range("10.0.0.0", "::1")
+
+
+def test_mac_index_normalises_notation(arp):
+    index = MACAddressIndex("mac")
+    index.build(arp)
+
+    assert "00-1a-2b-00-00-01" in index
+    assert "incomplete" not in index
+    assert "00:1a:2b:00:00:03" in index.keys()
+    assert _addresses(index.lookup("001a.2b00.0001")) == ["10.30.0.1"]
+    assert _addresses(index.oui("00:1a:2b")) == [
+        "10.30.0.1",
+        "2001:db8::1",
+        "10.20.3.1",
+    ]
+    with pytest.raises(ValueError, match="Invalid OUI"):
+        index.oui("001a")
+
+
+def test_queries_track_mutations(arp):
+    assert _addresses(arp.in_subnet("address", "10.20.0.0/16")) == [
+        "10.20.0.9",
+        "10.20.3.1",
+    ]
+    assert len(arp.with_oui("mac", "00:1a:2b")) == 3
+
+    del arp[0]
+    arp.append(ARPModel(address="10.20.1.1", mac="001a.2b00.00ff", interface="Vlan20"))
+    arp[0] = ARPModel(address="10.40.0.1", mac="0000.0000.0001", interface="Vlan40")
+
+    assert _addresses(arp.in_subnet("address", "10.20.0.0/16")) == [
+        "10.20.0.9",
+        "10.20.1.1",
+    ]
+    assert _addresses(arp.with_oui("mac", "001a2b")) == ["2001:db8::1", "10.20.1.1"]
+
+
+def test_queries_track_apply_update(arp):
+    arp.in_subnet("address", "10.0.0.0/8")
+
+    arp.apply_update(
+        [
+            {"address": "10.20.3.1", "mac": "001a.2b00.0003", "interface": "Vlan20"},
+            {"address": "10.50.0.1", "mac": "001a.2b00.0050", "interface": "Vlan50"},
+        ],
+        key="address",
+    )
+
+    assert _addresses(arp.in_subnet("address", "10.0.0.0/8")) == [
+        "10.20.3.1",
+        "10.50.0.1",
+    ]
+
+
+def test_arrow_queries_scan_without_indexes(tmp_path):
+    pytest.importorskip("pyarrow")
+    from net_model_translator.core.arrow_model_list import (
+        ArrowModelList,
+        ArrowModelListWriter,
+    )
+
+    rows = [dict(row, peer_mac=row["mac"]) for row in ARP_ROWS]
+    path = tmp_path / "arp.arrow"
+    with ArrowModelListWriter(path, ARPModel) as writer:
+        writer.write(rows[:2])
+        writer.write(rows[2:])
+    snapshot = ArrowModelList.open(path, ARPModel)
+    in_memory = ModelList(ARPModel, InputSchema, *[ARPModel(**row) for row in rows])
+
+    assert _addresses(snapshot.in_subnet("address", "10.20.0.0/16")) == _addresses(
+        in_memory.in_subnet("address", "10.20.0.0/16")
+    )
+    assert _addresses(snapshot.with_oui("mac", "00:1a:2b")) == _addresses(
+        in_memory.with_oui("mac", "00:1a:2b")
+    )
+    # Fields stored in the extras column are scanned through the decoded models.
+    assert _addresses(snapshot.with_oui("peer_mac", "aabbcc")) == ["10.20.0.9"]
+    assert snapshot._indexes == {}
+    with pytest.raises(TypeError, match="read-only"):
+        snapshot.create_index("address", kind="ip")
+    snapshot.close()
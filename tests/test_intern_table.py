@@ -0,0 +1,100 @@
+import threading
+
+from net_model_translator.core.intern_table import InternTable
+from net_model_translator.core.mapping import Mapping
+from net_model_translator.core.translator import Translator
+from net_model_translator.input_schemas.cdp_neighbors.ntc_templates import CiscoIOS
+
+
+def _copy(value: str) -> str:
+    return "".join(list(value))
+
+
+def test_equal_values_share_one_object():
+    table = InternTable()
+    first, second = _copy("Cisco IOS"), _copy("Cisco IOS")
+    assert first is not second
+
+    assert table.intern(first) is first
+    assert table.intern(second) is first
+    stats = table.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["bytes_saved"] > 0
+
+
+def test_values_of_different_types_are_not_merged():
+    table = InternTable()
+    table.intern(1)
+
+    assert table.intern(True) is True
+    assert table.intern([1]) == [1]
+
+
+def test_table_is_bounded_lru():
+    table = InternTable(max_size=2)
+    table.intern("a")
+    table.intern("b")
+    table.intern("a")
+    table.intern("c")
+
+    assert len(table) == 2
+    assert table.stats()["misses"] == 3
+    table.intern("b")
+    assert table.stats()["misses"] == 4
+
+
+def test_translator_interns_requested_fields(ios_cdp_records):
+    table = InternTable()
+    translator = Translator(
+        "cdp_neighbors",
+        raw_data=ios_cdp_records,
+        intern_fields=["platform", "capabilities"],
+        intern_table=table,
+    )
+
+    models = translator.translate()
+
+    assert len({id(model.platform) for model in models}) == 1
+    assert len({id(model.capabilities) for model in models}) == 1
+    assert table.stats()["size"] == 2
+    again = translator.translate([dict(record) for record in ios_cdp_records])
+    assert again[0].platform is models[0].platform
+
+
+def test_mapping_intern_flag_opts_fields_in(ios_cdp_records):
+    class InterningIOS(CiscoIOS):
+        platform: Mapping = Mapping(intern=True)
+
+    table = InternTable()
+    translator = Translator(
+        "cdp_neighbors",
+        raw_data=ios_cdp_records,
+        input_schema=InterningIOS,
+        intern_table=table,
+    )
+
+    models = translator.translate()
+
+    assert translator.data_mapper.intern_fields == {"platform"}
+    assert len({id(model.platform) for model in models}) == 1
+
+
+def test_concurrent_interning_at_capacity():
+    table = InternTable(max_size=8)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(20000):
+                table.intern(f"value-{(i + offset) % 16}")
+        except Exception as e:  # pragma: no cover - the failure being tested
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(table) == 8
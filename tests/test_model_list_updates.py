@@ -0,0 +1,142 @@
+from typing import Optional
+
+import pytest
+
+from net_model_translator.core.core_model import CoreModel
+from net_model_translator.core.input_schema import InputSchema
+from net_model_translator.core.model_list import ModelList
+from net_model_translator.core.translator import Translator
+
+
+class VlanModel(CoreModel):
+    vlan_id: int
+    platform: Optional[str] = None
+
+
+def _kinds(events):
+    return [event.kind for event in events]
+
+
+@pytest.fixture
+def vlans():
+    return ModelList(VlanModel, InputSchema)
+
+
+def test_update_emits_added_changed_removed(vlans):
+    received = []
+    vlans.subscribe(received.append)
+
+    first = vlans.apply_update(
+        [{"vlan_id": "10", "platform": "x"}, {"vlan_id": "20", "platform": "x"}],
+        key="vlan_id",
+    )
+    second = vlans.apply_update(
+        [{"vlan_id": "10", "platform": "y"}, {"vlan_id": "30"}], key="vlan_id"
+    )
+
+    assert _kinds(first) == ["added", "added"]
+    assert _kinds(second) == ["changed", "added", "removed"]
+    assert [event.key for event in second] == [10, 30, 20]
+    assert second[0].old.platform == "x" and second[0].new.platform == "y"
+    assert received == first + second
+    assert [(row.vlan_id, row.platform) for row in vlans] == [(10, "y"), (30, None)]
+
+
+def test_unchanged_poll_is_a_no_op_with_coerced_keys(vlans):
+    poll = [{"vlan_id": "10", "platform": "x"}, {"vlan_id": "20", "platform": "x"}]
+    vlans.apply_update(poll, key="vlan_id")
+    rows = list(vlans)
+
+    assert vlans.apply_update(poll, key="vlan_id") == []
+    assert len(vlans) == 2
+    assert all(a is b for a, b in zip(vlans, rows))
+
+
+def test_unchanged_poll_restores_directly_edited_row(vlans):
+    poll = [{"vlan_id": "10", "platform": "x"}]
+    vlans.apply_update(poll, key="vlan_id")
+    vlans[0] = {"vlan_id": 10, "platform": "edited"}
+
+    events = vlans.apply_update(poll, key="vlan_id")
+
+    assert _kinds(events) == ["changed"]
+    assert vlans[0].platform == "x"
+
+
+def test_duplicate_rows_for_a_key_are_collapsed(vlans):
+    vlans.apply_update([{"vlan_id": 10, "platform": "x"}], key="vlan_id")
+    vlans.append({"vlan_id": 10, "platform": "x"})
+
+    events = vlans.apply_update([{"vlan_id": 10, "platform": "y"}], key="vlan_id")
+
+    assert _kinds(events) == ["changed", "removed"]
+    assert [row.platform for row in vlans] == ["y"]
+
+
+def test_duplicate_incoming_keys_leave_list_unchanged(vlans):
+    vlans.apply_update([{"vlan_id": 1}], key="vlan_id")
+
+    with pytest.raises(ValueError, match="Duplicate key 10"):
+        vlans.apply_update([{"vlan_id": "10"}, {"vlan_id": 10}], key="vlan_id")
+
+    assert [row.vlan_id for row in vlans] == [1]
+
+
+def test_unsubscribe_stops_events(vlans):
+    received = []
+    vlans.subscribe(received.append)
+    vlans.unsubscribe(received.append)
+
+    vlans.apply_update([{"vlan_id": 1}], key="vlan_id")
+
+    assert received == []
+
+
+def test_indexed_filter_and_find_keep_list_order():
+    rows = ModelList(
+        VlanModel,
+        InputSchema,
+        *[{"vlan_id": i, "platform": "S"} for i in range(1, 10)],
+    )
+    rows.create_index("platform")
+    rows.sort_by("vlan_id", reverse=True)
+
+    assert [row.vlan_id for row in rows.filter(platform="S")] == list(range(9, 0, -1))
+    assert rows.find(platform="S").vlan_id == 9
+    assert rows.find(platform="missing") is None
+
+
+def test_indexes_follow_mutations():
+    rows = ModelList(VlanModel, InputSchema, {"vlan_id": 1, "platform": "a"})
+    index = rows.create_index("platform")
+
+    rows.append({"vlan_id": 2, "platform": "b"})
+    rows[0] = {"vlan_id": 1, "platform": "c"}
+    del rows[1]
+
+    assert index.keys() == ["c"]
+    assert rows.find(platform="c").vlan_id == 1
+
+
+def test_update_translated_list_uses_translator_mapping(ios_cdp_records):
+    models = Translator("cdp_neighbors", raw_data=ios_cdp_records).translate()
+    changed = [dict(record) for record in ios_cdp_records[1:]]
+    changed[0]["platform"] = "Cisco IOS XE"
+
+    models.apply_update(ios_cdp_records, key="hostname")
+    events = models.apply_update(changed, key="hostname")
+
+    assert _kinds(events) == ["changed", "removed"]
+    assert events[0].new.local_port == "Gi2/0/2"
+    assert len(models) == 9
+
+
+def test_disk_backed_list_accepts_subscribers(ios_cdp_records, tmp_path):
+    pytest.importorskip("pyarrow")
+    translator = Translator("cdp_neighbors", raw_data=ios_cdp_records)
+    snapshot = translator.translate_to_file(tmp_path / "snap.arrow")
+
+    snapshot.subscribe(print)
+    snapshot.unsubscribe(print)
+    with pytest.raises(TypeError):
+        snapshot.apply_update(ios_cdp_records, key="hostname")